@@ -17,6 +17,7 @@ from typing import (
     get_origin,
     get_args,
     Literal,
+    TextIO,
 )
 from pydantic import BaseModel, ValidationError
 from loguru import logger  # Import logger
@@ -111,6 +112,21 @@ def add_options(options):
     return _add_options
 
 
+# --- OpenAPI Specification Dump ---
+OPENAPI_SPEC_PATH = os.path.join(os.path.dirname(__file__), "openapi_reference.json")
+
+
+def dump_openapi_spec(file: Optional[TextIO] = None) -> None:
+    """
+    Write the bundled OpenAPI specification JSON to `file` (stdout by default).
+
+    Raises:
+        FileNotFoundError: If the specification file is missing from the package.
+    """
+    with open(OPENAPI_SPEC_PATH, "r") as f:
+        click.echo(f.read(), file=file)  # Use click.echo
+
+
 # --- Callback for --dump-openapi-specification ---
 def print_openapi_spec(ctx, param, value):
     """Callback function for the --dump-openapi-specification option."""
@@ -118,16 +134,13 @@ def print_openapi_spec(ctx, param, value):
         # Exit if the flag is not set, or if Click is doing resilient parsing (e.g., for completion)
         return
     try:
-        package_dir = os.path.dirname(__file__)
-        spec_path = os.path.join(package_dir, "openapi_reference.json")
-        if not os.path.exists(spec_path):
-            click.echo(
-                f"Error: Specification file not found at expected location: {spec_path}",
-                err=True,
-            )
-            ctx.exit(1)  # Use ctx.exit
-        with open(spec_path, "r") as f:
-            click.echo(f.read())  # Use click.echo
+        dump_openapi_spec()
+    except FileNotFoundError:
+        click.echo(
+            f"Error: Specification file not found at expected location: {OPENAPI_SPEC_PATH}",
+            err=True,
+        )
+        ctx.exit(1)  # Use ctx.exit
     except Exception as e:
         click.echo(f"Error reading or printing specification file: {e}", err=True)
         ctx.exit(1)  # Exit with error code if reading failed
@@ -62,6 +62,20 @@ except ImportError:
     BeautifulSoup = None  # Define as None if not available
 
 
+@functools.lru_cache(maxsize=None)
+@optional_typecheck
+def _load_openapi_spec(openapi_spec_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read and parse the OpenAPI specification file.
+
+    Cached per (path, modification time), so every client created in the same
+    process shares a single parse of the (large) JSON file, while an edited file
+    is still picked up. The returned dict must be treated as read-only.
+    """
+    with open(openapi_spec_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 @optional_typecheck
 class KarakeepAPI:
     """
@@ -80,6 +94,7 @@ class KarakeepAPI:
         api_endpoint (str): The endpoint of the Karakeep API instance, including /api/v1 (e.g., https://instance.com/api/v1/).
         openapi_spec (dict): The parsed content of the OpenAPI specification file.
         verify_ssl (bool): Whether SSL verification is enabled.
+        session (requests.Session): The HTTP session reused for all API calls (connection keep-alive).
         verbose (bool): Whether verbose logging is enabled.
         disable_response_validation (bool): Whether Pydantic response validation is disabled.
     """
@@ -213,8 +228,9 @@ class KarakeepAPI:
 
         self.openapi_spec: Optional[Dict[str, Any]] = None  # Initialize attribute
         try:
-            with open(openapi_spec_path, "r", encoding="utf-8") as f:
-                self.openapi_spec = json.load(f)
+            self.openapi_spec = _load_openapi_spec(
+                openapi_spec_path, os.stat(openapi_spec_path).st_mtime_ns
+            )
             logger.info(f"Successfully loaded OpenAPI spec from: {openapi_spec_path}")
         except FileNotFoundError:
             logger.error(
@@ -237,6 +253,9 @@ class KarakeepAPI:
 
         self.verify_ssl = verify_ssl
 
+        # Persistent HTTP session: keeps the TCP/TLS connection alive across calls
+        self.session = requests.Session()
+
         # --- Rate Limit Setting ---
         # Argument takes precedence over environment variable
         env_rate_limit_str = os.environ.get("KARAKEEP_PYTHON_API_RATE_LIMIT")
@@ -310,7 +329,7 @@ class KarakeepAPI:
     @optional_typecheck
     def _call(
         self,
-        method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"],
+        method: Literal["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"],
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[
@@ -318,13 +337,14 @@ class KarakeepAPI:
         ] = None,  # More specific type hint
         files: Optional[Dict[str, Any]] = None,
         extra_headers: Optional[Dict[str, str]] = None,
+        expected_error_codes: Tuple[int, ...] = (),
     ) -> Union[Dict[str, Any], List[Any], None, bytes]:
         """
         Internal method to make an HTTP call to the Karakeep API. Handles authentication,
         request formatting, response parsing, and error handling.
 
         Args:
-            method: HTTP method ('GET', 'POST', 'PUT', 'PATCH', 'DELETE').
+            method: HTTP method ('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE').
             endpoint: API endpoint path relative to the endpoint (e.g., 'bookmarks' or 'bookmarks/some_id').
                       Path parameters (like {bookmarkId}) MUST be substituted *before* calling _call.
             params: Dictionary of URL query parameters. Values should be primitive types suitable for URLs.
@@ -334,6 +354,9 @@ class KarakeepAPI:
                   - For bytes or str, ensure 'Content-Type' is set correctly via extra_headers if needed.
             files: Dictionary for file uploads (multipart/form-data). If provided, data parameter is ignored.
             extra_headers: Additional headers to include or override default headers.
+            expected_error_codes: HTTP error status codes the caller handles itself (e.g. 404
+                      when probing for existence). They still raise APIError but are only
+                      logged at DEBUG level instead of ERROR.
 
         Returns:
             The parsed JSON response from the API as a dict or list, None for 204 No Content responses,
@@ -489,7 +512,7 @@ class KarakeepAPI:
             else:
                 request_params = None
 
-            # Using requests.request directly for simplicity, session might be better for performance
+            # Reuse the client's session so consecutive calls share the pooled connection
             response = None
             trial = 0
             max_trial = 3
@@ -499,7 +522,7 @@ class KarakeepAPI:
                     # Enforce rate limit before making the request
                     self._enforce_rate_limit()
 
-                    response = requests.request(
+                    response = self.session.request(
                         method=method,
                         url=url,
                         params=request_params,  # Use params with stringified booleans
@@ -624,7 +647,12 @@ class KarakeepAPI:
                 if len(error_details) > max_log_len
                 else error_details
             )
-            logger.error(
+            log_error = (
+                logger.debug
+                if error_status_code in expected_error_codes
+                else logger.error
+            )
+            log_error(
                 f"API HTTP Error {error_status_code} for {method} {url}. Response: {log_details}"
             )
 
@@ -996,6 +1024,44 @@ class KarakeepAPI:
             # Response should match Bookmark schema
             return datatypes.Bookmark.model_validate(response_data)
 
+    @optional_typecheck
+    def bookmark_exists(self, bookmark_id: str) -> bool:
+        """
+        Check whether a bookmark exists without downloading it. Issues HEAD /bookmarks/{bookmarkId}.
+        This is not part of the OpenAPI spec: if the server rejects HEAD (405), falls back to a GET without content.
+
+        Args:
+            bookmark_id: The ID (string) of the bookmark to check.
+
+        Returns:
+            bool: True if the bookmark exists, False if the server answered 404.
+
+        Raises:
+            APIError: If the API request fails for any other reason than 404.
+        """
+        endpoint = f"bookmarks/{bookmark_id}"
+        try:
+            # 404 and 405 are answers here, not failures: don't log them as errors
+            self._call("HEAD", endpoint, expected_error_codes=(404, 405))
+        except APIError as e:
+            if e.status_code == 404:
+                return False
+            if e.status_code != 405:
+                raise
+            logger.debug("HEAD not allowed by the server, falling back to GET.")
+            try:
+                self._call(
+                    "GET",
+                    endpoint,
+                    params={"includeContent": False},
+                    expected_error_codes=(404,),
+                )
+            except APIError as get_error:
+                if get_error.status_code == 404:
+                    return False
+                raise
+        return True
+
     @optional_typecheck
     def delete_a_bookmark(self, bookmark_id: str) -> None:
         """
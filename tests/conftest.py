@@ -1,17 +1,57 @@
 import os
 import pytest
+from loguru import logger
 import time
-import random
-import string
+import secrets
 from typing import Optional
+from click.testing import CliRunner
 import beartype  # to trigger the runtime typechecking
 from karakeep_python_api import KarakeepAPI, datatypes
 
 
-@pytest.fixture
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all tests of the group on the same pytest-xdist worker (needs --dist loadgroup)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "slow: spawns a real interpreter, deselected by default (see pytest.ini), run with '-m slow'",
+    )
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """
+    Fixture that provides a Click CliRunner, used to invoke the CLI in-process
+    instead of paying for a new interpreter per command.
+    """
+    # Tests parse result.stdout as JSON, so loguru's stderr output must stay out
+    # of it: click < 8.2 mixes both unless asked not to, click >= 8.2 always keeps
+    # them apart and no longer accepts the argument
+    try:
+        return CliRunner(mix_stderr=False)
+    except TypeError:
+        return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def run_id() -> str:
+    """
+    Fixture that provides an identifier unique per test-suite run and per xdist
+    worker, used to name the resources the tests create.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return f"{int(time.time())}-{secrets.token_hex(3)}-{worker}"
+
+
+@pytest.fixture(scope="session")
 def karakeep_client():
     """
     Fixture that provides a configured Karakeep API client.
+    Session-scoped: one client (and its HTTP connection) per pytest session, so
+    with pytest-xdist one per worker process, each doing its own initial
+    connection check. The connection is closed once the session ends.
 
     Requires the following environment variables:
     - KARAKEEP_PYTHON_API_ENDPOINT
@@ -36,28 +76,31 @@ def karakeep_client():
 
     # Instantiate the client using standard environment variables
     # KarakeepAPI constructor handles api_endpoint and api_key directly
-    return KarakeepAPI(
+    client = KarakeepAPI(
         api_endpoint=api_endpoint,
         api_key=api_key,
         verify_ssl=verify_ssl,
         verbose=True,  # Enable verbose logging for tests
     )
+    yield client
 
+    # Release the pooled keep-alive connections at the end of the session
+    client.session.close()
 
-@pytest.fixture
-def managed_bookmark(karakeep_client: KarakeepAPI) -> datatypes.Bookmark:
+
+def _bookmark_lifecycle(karakeep_client: KarakeepAPI, label: str):
     """
-    Fixture to create a bookmark before a test and delete it afterwards.
-    Yields the created bookmark object.
+    Creates a uniquely named bookmark, yields it, and deletes it afterwards.
+    Shared by the bookmark fixtures below, which only differ by their scope.
     """
     created_bookmark_id: Optional[str] = None
     # Generate unique URL and title to avoid collisions and aid debugging
     timestamp = int(time.time())
-    random_suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    test_url = f"https://example.com/test_page_fixture_{timestamp}_{random_suffix}"
+    random_suffix = secrets.token_hex(3)
+    test_url = f"https://example.com/test_page_{label}_{timestamp}_{random_suffix}"
     original_title = f"Managed Fixture Bookmark {timestamp}-{random_suffix}"
 
-    print(
+    logger.info(
         f"\n  FIXTURE SETUP: Attempting to create bookmark (URL: {test_url}, Title: '{original_title}')"
     )
     try:
@@ -70,7 +113,7 @@ def managed_bookmark(karakeep_client: KarakeepAPI) -> datatypes.Bookmark:
         )
         assert bookmark.id, "Fixture: Created bookmark must have an ID"
         created_bookmark_id = bookmark.id
-        print(
+        logger.info(
             f"  FIXTURE SETUP: ✓ Successfully created bookmark with ID: {created_bookmark_id}"
         )
 
@@ -79,18 +122,51 @@ def managed_bookmark(karakeep_client: KarakeepAPI) -> datatypes.Bookmark:
     finally:
         # Teardown: Delete the bookmark
         if created_bookmark_id:
-            print(
+            logger.info(
                 f"\n  FIXTURE TEARDOWN: Attempting to delete bookmark ID: {created_bookmark_id}"
             )
             try:
                 karakeep_client.delete_a_bookmark(bookmark_id=created_bookmark_id)
-                print(
+                logger.info(
                     f"  FIXTURE TEARDOWN: ✓ Successfully deleted bookmark ID: {created_bookmark_id}"
                 )
+                # Verify deletion with a HEAD probe instead of a full GET expected to 404
+                if karakeep_client.bookmark_exists(bookmark_id=created_bookmark_id):
+                    logger.error(
+                        f"  FIXTURE TEARDOWN: ERROR bookmark ID {created_bookmark_id} still exists after deletion"
+                    )
+                    # pytest.fail raises a BaseException, it is not swallowed below
+                    pytest.fail(
+                        f"Bookmark {created_bookmark_id} still exists after deletion"
+                    )
+                else:
+                    logger.info(
+                        f"  FIXTURE TEARDOWN: ✓ Confirmed bookmark ID {created_bookmark_id} is deleted"
+                    )
             except Exception as e:
                 # Log error during teardown but don't let it mask original test failure
-                print(
+                logger.error(
                     f"  FIXTURE TEARDOWN: ERROR during bookmark deletion for ID {created_bookmark_id}: {e}"
                 )
         else:
-            print("\n  FIXTURE TEARDOWN: No bookmark ID recorded, skipping deletion.")
+            logger.info(
+                "\n  FIXTURE TEARDOWN: No bookmark ID recorded, skipping deletion."
+            )
+
+
+@pytest.fixture
+def managed_bookmark(karakeep_client: KarakeepAPI) -> datatypes.Bookmark:
+    """
+    Fixture to create a bookmark before a test and delete it afterwards.
+    Yields the created bookmark object. Use it for tests that modify the bookmark.
+    """
+    yield from _bookmark_lifecycle(karakeep_client, "fixture")
+
+
+@pytest.fixture(scope="module")
+def ephemeral_bookmark(karakeep_client: KarakeepAPI) -> datatypes.Bookmark:
+    """
+    Module-scoped variant of managed_bookmark: a single bookmark is created for
+    all the read-only tests of a module, then deleted. Tests must not modify it.
+    """
+    yield from _bookmark_lifecycle(karakeep_client, "module_fixture")
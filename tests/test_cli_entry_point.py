@@ -0,0 +1,32 @@
+import pytest
+from loguru import logger
+import subprocess
+import sys
+
+# The other CLI tests invoke the Click group in-process through CliRunner.
+# This one runs the real `python -m karakeep_python_api` entry point once.
+
+
+@pytest.mark.slow
+def test_cli_entry_point():
+    """Test that `python -m karakeep_python_api` starts and exits successfully."""
+    logger.info("\n  Running CLI entry point: --dump-openapi-specification")
+    try:
+        # This command doesn't require API key or endpoint
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "karakeep_python_api",
+                "--dump-openapi-specification",
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,  # Output is not checked, don't buffer it
+            stderr=subprocess.PIPE,
+        )
+        logger.info("✓ CLI entry point executed successfully.")
+    except subprocess.CalledProcessError as e:
+        logger.info(f"  CLI command failed with exit code {e.returncode}")
+        # stderr is only decoded if the command failed to aid debugging
+        logger.info(f"  Stderr: {e.stderr.decode(errors='replace')}")
+        pytest.fail(f"CLI command '--dump-openapi-specification' failed: {e}")
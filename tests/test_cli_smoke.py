@@ -0,0 +1,99 @@
+import pytest
+from loguru import logger
+import json
+from typing import List, Optional
+from click.testing import CliRunner
+import beartype  # to trigger the runtime typechecking
+
+from karakeep_python_api import KarakeepAPI
+from karakeep_python_api.__main__ import cli
+
+# CLI smoke checks: every command below must launch and exit 0.
+# API behavior itself is verified in test_karakeep_api.py, these only make sure
+# the dynamically generated Click commands are wired correctly.
+
+CLI_SMOKE_CASES = [
+    pytest.param(["get-all-bookmarks", "--limit", "2"], id="get-all-bookmarks"),
+    pytest.param(["get-all-lists"], id="get-all-lists"),
+    pytest.param(["get-all-tags"], id="get-all-tags"),
+    pytest.param(["get-all-highlights", "--limit", "3"], id="get-all-highlights"),
+    pytest.param(["get-current-user-stats"], id="get-current-user-stats"),
+    # Query that matches nothing: checks the wiring and output format, not search itself
+    pytest.param(
+        ["search-bookmarks", "--q", "xyz_nonexistent_zyx", "--limit", "1"],
+        id="search-bookmarks",
+    ),
+    # Unknown ID: the command must answer false (404 is a valid answer, not an error)
+    pytest.param(
+        ["bookmark-exists", "--bookmark-id", "nonexistent_bookmark_id"],
+        id="bookmark-exists",
+    ),
+    pytest.param(["--dump-openapi-specification"], id="dump-openapi-specification"),
+]
+
+
+@pytest.mark.parametrize("argv", CLI_SMOKE_CASES)
+def test_cli_smoke(request, cli_runner: CliRunner, argv: List[str]):
+    """Test that the CLI command launches and exits successfully."""
+    if not argv[0].startswith("--"):
+        # API commands need a live instance, this skips if the env vars are missing
+        request.getfixturevalue("karakeep_client")
+
+    logger.info(f"\n  Running CLI command: {' '.join(argv)}")
+    result = cli_runner.invoke(cli, argv, obj={})
+    if result.exit_code != 0:
+        logger.info(f"  CLI command failed with exit code {result.exit_code}")
+        # Output is only logged if the command failed to aid debugging
+        logger.info(f"  Output: {result.output}")
+    assert result.exit_code == 0, (
+        f"CLI command '{' '.join(argv)}' failed with exit code {result.exit_code}: {result.exception}"
+    )
+    if argv[0] == "search-bookmarks":
+        search_output = json.loads(result.stdout)
+        assert isinstance(search_output.get("bookmarks"), list), (
+            "search-bookmarks output should contain a 'bookmarks' list"
+        )
+    if argv[0] == "bookmark-exists":
+        assert json.loads(result.stdout) is False, (
+            "bookmark-exists should print false for an unknown bookmark ID"
+        )
+    logger.info("✓ CLI command executed successfully.")
+
+
+def test_cli_create_a_new_bookmark(
+    karakeep_client: KarakeepAPI, cli_runner: CliRunner, run_id: str
+):
+    """Test creating a bookmark through the CLI, then delete it through the API."""
+    created_bookmark_id: Optional[str] = None
+    bookmark_url = f"https://example.com/test_page_cli_{run_id}"
+    argv = ["create-a-new-bookmark", "--type", "link", "--url", bookmark_url]
+    try:
+        logger.info(f"\n  Running CLI command: {' '.join(argv)}")
+        result = cli_runner.invoke(cli, argv, obj={})
+        if result.exit_code != 0:
+            logger.info(f"  CLI command failed with exit code {result.exit_code}")
+            logger.info(f"  Output: {result.output}")
+        assert result.exit_code == 0, (
+            f"CLI command '{' '.join(argv)}' failed with exit code {result.exit_code}: {result.exception}"
+        )
+
+        created_bookmark = json.loads(result.stdout)
+        created_bookmark_id = created_bookmark.get("id")
+        assert created_bookmark_id, "CLI created bookmark must have an ID"
+        logger.info(f"✓ CLI created bookmark with ID: {created_bookmark_id}")
+
+    finally:
+        if created_bookmark_id:
+            logger.info(
+                f"\n  CLI TEARDOWN: Attempting to delete bookmark ID: {created_bookmark_id}"
+            )
+            try:
+                karakeep_client.delete_a_bookmark(bookmark_id=created_bookmark_id)
+                logger.info(
+                    f"  CLI TEARDOWN: ✓ Successfully deleted bookmark ID: {created_bookmark_id}"
+                )
+            except Exception as e:
+                # Log error during teardown but don't let it mask original test failure
+                logger.error(
+                    f"  CLI TEARDOWN: ERROR during bookmark deletion for ID {created_bookmark_id}: {e}"
+                )
@@ -1,221 +1,112 @@
 import pytest
 from loguru import logger
-import os
 import subprocess
-import random
-import string
 import time
+from click.testing import CliRunner
 import beartype  # to trigger the runtime typechecking
+import io
 import json  # Added for CLI test payload generation
+from typing import Optional
+from pydantic import BaseModel, Field, StrictInt
 
 # Import API, errors, and datatypes from the main package
 from karakeep_python_api import KarakeepAPI, APIError, AuthenticationError, datatypes
+from karakeep_python_api.__main__ import cli, dump_openapi_spec
 
 # Note: The karakeep_client fixture is defined in conftest.py and provides a valid client instance.
 
 # --- Test 'Get All' Endpoints ---
 
 
-def test_get_all_bookmarks_paginated(karakeep_client: KarakeepAPI):
-    """Test retrieving bookmarks with pagination."""
+@pytest.mark.parametrize(
+    "method, container_model, item_attr, item_model, limit",
+    [
+        pytest.param(
+            "get_all_bookmarks",
+            datatypes.PaginatedBookmarks,
+            "bookmarks",
+            datatypes.Bookmark,
+            2,
+            id="bookmarks",
+        ),
+        pytest.param(
+            "get_all_highlights",
+            datatypes.PaginatedHighlights,
+            "highlights",
+            datatypes.Highlight,
+            3,
+            id="highlights",
+        ),
+        pytest.param(
+            "get_all_lists", list, None, datatypes.ListModel, None, id="lists"
+        ),
+        pytest.param(
+            "get_all_tags",
+            datatypes.PaginatedTags,
+            "tags",
+            datatypes.Tag,
+            None,
+            id="tags",
+        ),
+    ],
+)
+def test_get_all(
+    karakeep_client: KarakeepAPI,
+    method: str,
+    container_model: type,
+    item_attr: Optional[str],
+    item_model: type,
+    limit: Optional[int],
+):
+    """
+    Test the 'get all' endpoints. When a limit is given, also test pagination
+    by fetching the second page.
+    """
+    api_method = getattr(karakeep_client, method)
+    kwargs = {"limit": limit} if limit is not None else {}
     try:
         # Get the first page
-        page1 = karakeep_client.get_all_bookmarks(limit=2)
-        assert isinstance(page1, datatypes.PaginatedBookmarks), (
-            "Response should be PaginatedBookmarks model"
-        )
-        assert isinstance(page1.bookmarks, list), "Bookmarks attribute should be a list"
-        assert len(page1.bookmarks) <= 2, "Should return at most 'limit' bookmarks"
-        logger.info(f"✓ Retrieved first page with {len(page1.bookmarks)} bookmarks.")
-
-        # If there's a next cursor, get the next page
-        if page1.nextCursor:
-            logger.info(
-                f"  Attempting to fetch next page with cursor: {page1.nextCursor}"
-            )
-            page2 = karakeep_client.get_all_bookmarks(limit=2, cursor=page1.nextCursor)
-            assert isinstance(page2, datatypes.PaginatedBookmarks)
-            assert isinstance(page2.bookmarks, list)
-            assert len(page2.bookmarks) <= 2
-            logger.info(
-                f"✓ Retrieved second page with {len(page2.bookmarks)} bookmarks."
+        page1 = api_method(**kwargs)
+        assert isinstance(page1, container_model), (
+            f"Response should be {container_model.__name__}"
+        )
+        items1 = getattr(page1, item_attr) if item_attr else page1
+        assert isinstance(items1, list), f"{item_attr or 'Response'} should be a list"
+        # The client validated the whole response into the container model, so
+        # checking the first item is enough to know which model items were parsed to
+        if items1:
+            assert isinstance(items1[0], item_model), (
+                f"Items should be {item_model.__name__} instances"
             )
-            # Ensure bookmarks are different from page 1 (simple check)
-            if page1.bookmarks and page2.bookmarks:
-                assert page1.bookmarks[0].id != page2.bookmarks[0].id, (
-                    "Bookmarks on page 1 and 2 should differ"
-                )
-        else:
-            logger.info("  No next cursor found, pagination test ends.")
-
-    except (APIError, AuthenticationError) as e:
-        pytest.fail(f"API error during paginated bookmark retrieval: {e}")
-    except Exception as e:
-        pytest.fail(
-            f"An unexpected error occurred during paginated bookmark retrieval: {e}"
-        )
-
-    # --- Add CLI call ---
-    try:
-        logger.info("\n  Running CLI equivalent: get-all-bookmarks --limit 2")
-        # Assumes KARAKEEP_PYTHON_API_ENDPOINT and KARAKEEP_PYTHON_API_KEY are set in env
-        subprocess.run(
-            "python -m karakeep_python_api get-all-bookmarks --limit 2",
-            shell=True,
-            check=True,
-            capture_output=True,  # Capture output to avoid logger.infoing it during tests unless verbose
-            text=True,
-        )
-        logger.info("✓ CLI command executed successfully.")
-    except subprocess.CalledProcessError as e:
-        logger.info(f"  CLI command failed with exit code {e.returncode}")
-        # logger.info stdout/stderr only if the command failed to aid debugging
-        logger.info(f"  Stdout: {e.stdout}")
-        logger.info(f"  Stderr: {e.stderr}")
-        pytest.fail(f"CLI command 'get-all-bookmarks --limit 2' failed: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred running the CLI command: {e}")
-
-
-def test_get_all_lists(karakeep_client: KarakeepAPI):
-    """Test retrieving all lists."""
-    try:
-        lists = karakeep_client.get_all_lists()
-        assert isinstance(lists, list), "Response should be a list"
-        if lists:  # Only check elements if the list is not empty
-            assert all(isinstance(item, datatypes.ListModel) for item in lists), (
-                "All items should be ListModel instances"
-            )
-        logger.info(f"✓ Successfully retrieved {len(lists)} lists.")
-    except (APIError, AuthenticationError) as e:
-        pytest.fail(f"API error during list retrieval: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred during list retrieval: {e}")
-
-    # --- Add CLI call ---
-    try:
-        logger.info("\n  Running CLI equivalent: get-all-lists")
-        # Assumes KARAKEEP_PYTHON_API_ENDPOINT and KARAKEEP_PYTHON_API_KEY are set in env
-        subprocess.run(
-            "python -m karakeep_python_api get-all-lists",
-            shell=True,
-            check=True,
-            capture_output=True,  # Capture output to avoid logger.infoing it during tests unless verbose
-            text=True,
-        )
-        logger.info("✓ CLI command executed successfully.")
-    except subprocess.CalledProcessError as e:
-        logger.info(f"  CLI command failed with exit code {e.returncode}")
-        # logger.info stdout/stderr only if the command failed to aid debugging
-        logger.info(f"  Stdout: {e.stdout}")
-        logger.info(f"  Stderr: {e.stderr}")
-        pytest.fail(f"CLI command 'get-all-lists' failed: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred running the CLI command: {e}")
-
-
-def test_get_all_tags(karakeep_client: KarakeepAPI):
-    """Test retrieving all tags."""
-    try:
-        tags = karakeep_client.get_all_tags()
-        assert isinstance(tags, datatypes.PaginatedTags), (
-            "Response should be of type PaginatedTags"
-        )
-        tags = tags.tags
-        assert isinstance(tags, list), "tags var should be of type list at this point"
-        if tags:  # Only check elements if the list is not empty
-            assert all(isinstance(item, datatypes.Tag) for item in tags), (
-                "All items should be Tag instances"
-            )
-        logger.info(f"✓ Successfully retrieved {len(tags)} tags.")
-    except (APIError, AuthenticationError) as e:
-        pytest.fail(f"API error during tag retrieval: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred during tag retrieval: {e}")
-
-    # --- Add CLI call ---
-    try:
-        logger.info("\n  Running CLI equivalent: get-all-tags")
-        # Assumes KARAKEEP_PYTHON_API_ENDPOINT and KARAKEEP_PYTHON_API_KEY are set in env
-        subprocess.run(
-            "python -m karakeep_python_api get-all-tags",
-            shell=True,
-            check=True,
-            capture_output=True,  # Capture output to avoid logger.infoing it during tests unless verbose
-            text=True,
-        )
-        logger.info("✓ CLI command executed successfully.")
-    except subprocess.CalledProcessError as e:
-        logger.info(f"  CLI command failed with exit code {e.returncode}")
-        # logger.info stdout/stderr only if the command failed to aid debugging
-        logger.info(f"  Stdout: {e.stdout}")
-        logger.info(f"  Stderr: {e.stderr}")
-        pytest.fail(f"CLI command 'get-all-tags' failed: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred running the CLI command: {e}")
+        if limit is not None:
+            assert len(items1) <= limit, f"Should return at most {limit} items"
+        logger.info(f"✓ {method}: retrieved first page with {len(items1)} items.")
 
-
-def test_get_all_highlights_paginated(karakeep_client: KarakeepAPI):
-    """Test retrieving highlights with pagination."""
-    try:
-        # Get the first page
-        page1 = karakeep_client.get_all_highlights(limit=3)
-        assert isinstance(page1, datatypes.PaginatedHighlights), (
-            "Response should be PaginatedHighlights model"
-        )
-        assert isinstance(page1.highlights, list), (
-            "Highlights attribute should be a list"
-        )
-        assert len(page1.highlights) <= 3, "Should return at most 'limit' highlights"
-        logger.info(f"✓ Retrieved first page with {len(page1.highlights)} highlights.")
+        if limit is None:
+            return
 
         # If there's a next cursor, get the next page
+        # (it depends on page 1's cursor, so it can't be fetched ahead of time)
         if page1.nextCursor:
             logger.info(
                 f"  Attempting to fetch next page with cursor: {page1.nextCursor}"
             )
-            page2 = karakeep_client.get_all_highlights(limit=3, cursor=page1.nextCursor)
-            assert isinstance(page2, datatypes.PaginatedHighlights)
-            assert isinstance(page2.highlights, list)
-            assert len(page2.highlights) <= 3
-            logger.info(
-                f"✓ Retrieved second page with {len(page2.highlights)} highlights."
-            )
-            # Ensure highlights are different from page 1 (simple check)
-            if page1.highlights and page2.highlights:
-                assert page1.highlights[0].id != page2.highlights[0].id, (
-                    "Highlights on page 1 and 2 should differ"
+            page2 = api_method(limit=limit, cursor=page1.nextCursor)
+            assert isinstance(page2, container_model)
+            items2 = getattr(page2, item_attr)
+            assert isinstance(items2, list)
+            assert len(items2) <= limit
+            logger.info(f"✓ {method}: retrieved second page with {len(items2)} items.")
+            # Ensure items are different from page 1 (simple check)
+            if items1 and items2:
+                assert items1[0].id != items2[0].id, (
+                    "Items on page 1 and 2 should differ"
                 )
         else:
             logger.info("  No next cursor found, pagination test ends.")
 
     except (APIError, AuthenticationError) as e:
-        pytest.fail(f"API error during paginated highlight retrieval: {e}")
-    except Exception as e:
-        pytest.fail(
-            f"An unexpected error occurred during paginated highlight retrieval: {e}"
-        )
-
-    # --- Add CLI call ---
-    try:
-        logger.info("\n  Running CLI equivalent: get-all-highlights --limit 3")
-        # Assumes KARAKEEP_PYTHON_API_ENDPOINT and KARAKEEP_PYTHON_API_KEY are set in env
-        subprocess.run(
-            "python -m karakeep_python_api get-all-highlights --limit 3",
-            shell=True,
-            check=True,
-            capture_output=True,  # Capture output to avoid logger.infoing it during tests unless verbose
-            text=True,
-        )
-        logger.info("✓ CLI command executed successfully.")
-    except subprocess.CalledProcessError as e:
-        logger.info(f"  CLI command failed with exit code {e.returncode}")
-        # logger.info stdout/stderr only if the command failed to aid debugging
-        logger.info(f"  Stdout: {e.stdout}")
-        logger.info(f"  Stderr: {e.stderr}")
-        pytest.fail(f"CLI command 'get-all-highlights --limit 3' failed: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred running the CLI command: {e}")
+        pytest.fail(f"API error during {method}: {e}")
 
 
 # --- Test Client Initialization and Attributes ---
@@ -223,68 +114,41 @@ def test_get_all_highlights_paginated(karakeep_client: KarakeepAPI):
 
 def test_openapi_spec_accessible(karakeep_client: KarakeepAPI):
     """Test that the openapi_spec attribute is loaded and accessible."""
-    try:
-        spec = karakeep_client.openapi_spec
-        assert spec is not None, "openapi_spec attribute should not be None"
-        assert isinstance(spec, dict), "openapi_spec should be a dictionary"
-        # Check for a top-level key expected in an OpenAPI spec
-        assert "openapi" in spec, (
-            "openapi_spec should contain the 'openapi' version key"
-        )
-        logger.info(
-            f"✓ Successfully accessed openapi_spec attribute. Version: {spec.get('openapi', 'N/A')}"
-        )
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred while accessing openapi_spec: {e}")
-
-    # --- Add CLI call ---
-    # The closest CLI equivalent is dumping the spec file content
-    try:
-        logger.info("\n  Running CLI equivalent: --dump-openapi-specification")
-        # This command doesn't require API key or endpoint
-        subprocess.run(
-            "python -m karakeep_python_api --dump-openapi-specification",
-            shell=True,
-            check=True,
-            capture_output=True,  # Capture output to avoid logger.infoing it during tests unless verbose
-            text=True,
-        )
-        logger.info("✓ CLI command executed successfully.")
-    except subprocess.CalledProcessError as e:
-        logger.info(f"  CLI command failed with exit code {e.returncode}")
-        # logger.info stdout/stderr only if the command failed to aid debugging
-        logger.info(f"  Stdout: {e.stdout}")
-        logger.info(f"  Stderr: {e.stderr}")
-        pytest.fail(f"CLI command '--dump-openapi-specification' failed: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred running the CLI command: {e}")
+    spec = karakeep_client.openapi_spec
+    assert spec is not None, "openapi_spec attribute should not be None"
+    assert isinstance(spec, dict), "openapi_spec should be a dictionary"
+    # Check for a top-level key expected in an OpenAPI spec
+    assert "openapi" in spec, "openapi_spec should contain the 'openapi' version key"
+    logger.info(
+        f"✓ Successfully accessed openapi_spec attribute. Version: {spec.get('openapi', 'N/A')}"
+    )
+
+    # The CLI's --dump-openapi-specification goes through the same dumper
+    buf = io.StringIO()
+    dump_openapi_spec(buf)
+    assert buf.tell() > 0, "Dumped specification should not be empty"
+    assert '"openapi"' in buf.getvalue()[:2048], (
+        "Dumped specification should contain the 'openapi' version key"
+    )
+    logger.info("✓ Successfully dumped the OpenAPI specification.")
 
 
 # --- Test Create/Delete Operations ---
 
 
-def test_create_and_delete_list(karakeep_client: KarakeepAPI):
+def test_create_and_delete_list(karakeep_client: KarakeepAPI, run_id: str):
     """Test creating a new list and then deleting it."""
     created_list_id = None  # Initialize to ensure it's available in finally block
     try:
-        # 1. Generate a unique list name
-        timestamp = int(time.time())
-        random_suffix = "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=6)
-        )
-        list_name = f"Test List {timestamp}-{random_suffix}"
+        # 1. Use a unique list name (run_id is unique per run and per xdist worker)
+        list_name = f"Test List {run_id}"
         list_icon = "🧪"  # Test tube icon
 
         logger.info(
             f"\nAttempting to create list: Name='{list_name}', Icon='{list_icon}'"
         )
 
-        # 2. Get initial list count (optional, for comparison)
-        initial_lists = karakeep_client.get_all_lists()
-        initial_list_count = len(initial_lists)
-        logger.info(f"  Initial list count: {initial_list_count}")
-
-        # 3. Create the new list
+        # 2. Create the new list
         created_list = karakeep_client.create_a_new_list(
             name=list_name, icon=list_icon, list_type="manual"
         )
@@ -295,110 +159,84 @@ def test_create_and_delete_list(karakeep_client: KarakeepAPI):
         assert created_list.icon == list_icon, "Created list icon should match"
         assert created_list.id, "Created list must have an ID"
         created_list_id = created_list.id  # Store the ID for deletion
+        # The create response already holds the full list, no need to GET it again
         logger.info(f"✓ Successfully created list with ID: {created_list_id}")
 
-        # 4. Verify the list appears in get_all_lists
-        current_lists_after_create = karakeep_client.get_all_lists()
-        assert len(current_lists_after_create) == initial_list_count + 1, (
-            "List count should increase by one after creation"
-        )
-        assert any(lst.id == created_list_id for lst in current_lists_after_create), (
-            "Created list should be present in the list of all lists"
-        )
-        logger.info(f"  List count after creation: {len(current_lists_after_create)}")
-        logger.info(f"✓ Verified list {created_list_id} is present in get_all_lists.")
-
-        # 5. Verify the list exists by getting it directly (redundant but good check)
-        retrieved_list = karakeep_client.get_a_single_list(list_id=created_list_id)
-        assert isinstance(retrieved_list, datatypes.ListModel)
-        assert retrieved_list.id == created_list_id
-        logger.info(f"✓ Successfully retrieved the created list by ID.")
-
     except (APIError, AuthenticationError) as e:
         pytest.fail(f"API error during list creation/verification: {e}")
-    except Exception as e:
-        pytest.fail(
-            f"An unexpected error occurred during list creation/verification: {e}"
-        )
     finally:
-        # 6. Delete the list (ensure cleanup even if assertions fail)
+        # 3. Delete the list (ensure cleanup even if assertions fail)
         if created_list_id:
             logger.info(f"\nAttempting to delete list with ID: {created_list_id}")
             try:
                 karakeep_client.delete_a_list(list_id=created_list_id)
                 logger.info(f"✓ Successfully deleted list with ID: {created_list_id}")
 
-                # 7. Verify the list is gone by trying to get it (should fail)
-                try:
+                # 4. Verify the list is gone by trying to get it (should fail)
+                with pytest.raises(APIError) as excinfo:
                     karakeep_client.get_a_single_list(list_id=created_list_id)
-                    pytest.fail(
-                        f"List with ID {created_list_id} should not exist after deletion, but get_a_single_list succeeded."
-                    )
-                except APIError as e:
-                    assert e.status_code == 404, (
-                        f"Expected 404 Not Found when getting deleted list, but got status {e.status_code}"
-                    )
-                    logger.info(
-                        f"✓ Confirmed list {created_list_id} is deleted (received 404)."
-                    )
-
-                # 8. Verify list count decreased (optional check)
-                final_lists = karakeep_client.get_all_lists()
-                assert len(final_lists) == initial_list_count, (
-                    "List count should return to initial count after deletion"
+                assert excinfo.value.status_code == 404, (
+                    f"Expected 404 Not Found when getting deleted list, but got status {excinfo.value.status_code}"
                 )
-                assert not any(lst.id == created_list_id for lst in final_lists), (
-                    "Deleted list should not be present in the final list of all lists"
+                logger.info(
+                    f"✓ Confirmed list {created_list_id} is deleted (received 404)."
                 )
-                logger.info(f"  Final list count: {len(final_lists)}")
 
             except (APIError, AuthenticationError) as e:
                 pytest.fail(f"API error during list deletion: {e}")
-            except Exception as e:
-                pytest.fail(f"An unexpected error occurred during list deletion: {e}")
         else:
             logger.info(
                 "\nSkipping deletion because list creation failed or ID was not obtained."
             )
 
 
-def test_create_and_delete_bookmark(
-    karakeep_client: KarakeepAPI, managed_bookmark: datatypes.Bookmark
+# The read-only bookmark tests share one module-scoped bookmark, kept on a single
+# xdist worker so it is only created and deleted once.
+@pytest.mark.xdist_group("karakeep_ephemeral_bookmark")
+def test_bookmark_retrievable(
+    karakeep_client: KarakeepAPI, ephemeral_bookmark: datatypes.Bookmark
 ):
     """
-    Test verifying a created bookmark (via fixture) and searching for it.
+    Test verifying a created bookmark (via fixture) exists.
     The fixture handles creation and deletion.
     """
-    created_bookmark_id = managed_bookmark.id
-    test_url = managed_bookmark.content.url  # Get URL from fixture
-    original_title = managed_bookmark.title  # Get title from fixture
+    created_bookmark_id = ephemeral_bookmark.id
+    logger.info(
+        f"\nUsing ephemeral bookmark ID: {created_bookmark_id}, URL: '{ephemeral_bookmark.content.url}', Title: '{ephemeral_bookmark.title}'"
+    )
 
     try:
-        # 1. Bookmark is already created by the 'managed_bookmark' fixture.
-        logger.info(
-            f"\nUsing managed bookmark ID: {created_bookmark_id}, URL: '{test_url}', Title: '{original_title}'"
+        # Verify the bookmark exists (HEAD, no payload to download or validate)
+        assert karakeep_client.bookmark_exists(bookmark_id=created_bookmark_id), (
+            f"Ephemeral bookmark {created_bookmark_id} should exist"
         )
+        logger.info("✓ Verified the ephemeral bookmark exists.")
+
+    except (APIError, AuthenticationError) as e:
+        pytest.fail(f"API error during bookmark verification: {e}")
 
-        # 2. Verify the bookmark exists by getting it directly
-        retrieved_bookmark = karakeep_client.get_a_single_bookmark(
-            bookmark_id=created_bookmark_id
-        )
-        assert isinstance(retrieved_bookmark, datatypes.Bookmark)
-        assert retrieved_bookmark.id == created_bookmark_id
-        assert retrieved_bookmark.content.url == test_url
-        assert retrieved_bookmark.title == original_title
-        logger.info(f"✓ Successfully retrieved the managed bookmark by ID.")
 
-        # 3. Search for the created bookmark
+@pytest.mark.xdist_group("karakeep_ephemeral_bookmark")
+def test_bookmark_searchable(
+    karakeep_client: KarakeepAPI, ephemeral_bookmark: datatypes.Bookmark
+):
+    """
+    Test searching for a created bookmark (via fixture).
+    The fixture handles creation and deletion, and verifies the deletion.
+    """
+    created_bookmark_id = ephemeral_bookmark.id
+    original_title = ephemeral_bookmark.title
+
+    try:
         # Use a search query that is likely to match the fixture's title
         # The fixture title is "Managed Fixture Bookmark {timestamp}-{random_suffix}"
         # A simple search for "Managed Fixture Bookmark" should work.
         # If the title is very dynamic, searching by URL might be more robust if supported,
         # or by a known part of the title.
 
-        # waiting a bit for the indexation just in case
-        time.sleep(30)
-
+        # Indexation is asynchronous: poll with exponential backoff (1s, 2s, 4s,
+        # then 8s) and stop as soon as the bookmark shows up, cycling through
+        # query variants because search is nondeterministic
         search_queries = [
             "Managed Fixture Bookmark",
             "managed fixture bookmark",
@@ -407,9 +245,13 @@ def test_create_and_delete_bookmark(
             "fixture",
             '"fixture"',
         ]
-        for trial, search_query_component in enumerate(search_queries):
+        max_trials = 8
+        delay = 1.0
+        waited = 0.0
+        for trial in range(max_trials):
+            search_query_component = search_queries[trial % len(search_queries)]
             logger.info(
-                f"\nAttempting to search for bookmark with query based on title: '{search_query_component}'. Retrying multiple times because search is nondeterministic."
+                f"\nAttempting to search for bookmark with query based on title: '{search_query_component}' (trial {trial + 1}/{max_trials}, waited {waited:.0f}s so far)."
             )
             search_results = karakeep_client.search_bookmarks(
                 q=search_query_component, limit=100, include_content=False
@@ -422,63 +264,29 @@ def test_create_and_delete_bookmark(
             )
 
             titles_in_search = [b.title for b in search_results.bookmarks]
-            found_in_search = any(
-                b.id == created_bookmark_id for b in search_results.bookmarks
+            found_in_search = created_bookmark_id in frozenset(
+                b.id for b in search_results.bookmarks
             )
-            if found_in_search:
+            if found_in_search or trial == max_trials - 1:
                 break
-            else:
-                time.sleep(3)
+            time.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, 8.0)
         assert found_in_search, (
-            f"Managed bookmark {created_bookmark_id} (Title: '{original_title}') not found in {trial + 1} different search results for '{search_query_component}'. Titles were: '{titles_in_search}'."
+            f"Ephemeral bookmark {created_bookmark_id} (Title: '{original_title}') not found in {trial + 1} search results after waiting {waited:.0f}s, last query '{search_query_component}'. Titles were: '{titles_in_search}'."
         )
         logger.info(
-            f"✓ Found managed bookmark in search results for '{search_query_component}'."
+            f"✓ Found ephemeral bookmark in search results for '{search_query_component}'."
         )
 
-        # 4. Test CLI search equivalent
-        logger.info(
-            f"\n  Running CLI equivalent: search-bookmarks --q '{search_query_component}' --limit 10 --include-content false"
-        )
-        try:
-            cli_search_command = f"python -m karakeep_python_api search-bookmarks --q '{search_query_component}' --limit 10 --include-content false"
-            search_cli_output = subprocess.run(
-                cli_search_command,
-                shell=True,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            assert created_bookmark_id in search_cli_output.stdout, (
-                f"Managed bookmark ID {created_bookmark_id} not found in CLI search output for '{search_query_component}'"
-            )
-            logger.info(
-                "✓ CLI search command executed successfully and contained the bookmark ID."
-            )
-        except subprocess.CalledProcessError as e:
-            logger.info(f"  CLI search command failed with exit code {e.returncode}")
-            logger.info(f"  Stdout: {e.stdout}")
-            logger.info(f"  Stderr: {e.stderr}")
-            pytest.fail(
-                f"CLI command 'search-bookmarks --q \"{search_query_component}\"' failed: {e}"
-            )
-        except Exception as e:
-            pytest.fail(
-                f"An unexpected error occurred running the CLI search command: {e}"
-            )
-
     except (APIError, AuthenticationError) as e:
-        pytest.fail(f"API error during bookmark verification/search: {e}")
-    except Exception as e:
-        pytest.fail(
-            f"An unexpected error occurred during bookmark verification/search: {e}"
-        )
-    # No 'finally' block for deletion needed, as 'managed_bookmark' fixture handles it.
-    # The fixture also handles verification of deletion.
+        pytest.fail(f"API error during bookmark search: {e}")
 
 
 def test_update_bookmark_title(
-    karakeep_client: KarakeepAPI, managed_bookmark: datatypes.Bookmark
+    karakeep_client: KarakeepAPI,
+    managed_bookmark: datatypes.Bookmark,
+    cli_runner: CliRunner,
 ):
     """Test updating a bookmark's title via API and CLI, using a managed bookmark."""
     created_bookmark_id = managed_bookmark.id
@@ -512,86 +320,61 @@ def test_update_bookmark_title(
             f"✓ API call to update_a_bookmark successful. Partial response title: '{updated_bookmark_partial.get('title')}'"
         )
 
-        # 2. Verify the API update by fetching the bookmark again
-        logger.info(
-            f"\nFetching bookmark ID {created_bookmark_id} to verify API title update."
-        )
-        retrieved_bookmark_after_api_update = karakeep_client.get_a_single_bookmark(
-            bookmark_id=created_bookmark_id
-        )
-        assert isinstance(retrieved_bookmark_after_api_update, datatypes.Bookmark)
-        assert retrieved_bookmark_after_api_update.title == target_api_title, (
-            f"Retrieved bookmark title '{retrieved_bookmark_after_api_update.title}' does not match expected API-updated title '{target_api_title}'"
-        )
-        logger.info(
-            f"✓ Successfully verified bookmark title updated by API to: '{retrieved_bookmark_after_api_update.title}'"
-        )
-
-        # 3. Test CLI equivalent for updating the bookmark's title
+        # 2. Test CLI equivalent for updating the bookmark's title
         logger.info(
             f"\n  Running CLI equivalent to update title to: '{target_cli_title}'"
         )
         cli_update_payload_json = json.dumps({"title": target_cli_title})
-        # Ensure the JSON string is properly quoted for the shell command
-        cli_update_command = f"python -m karakeep_python_api update-a-bookmark --bookmark-id {created_bookmark_id} --update-data '{cli_update_payload_json}'"
-
-        try:
-            subprocess.run(
-                cli_update_command,
-                shell=True,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            logger.info("✓ CLI update command executed successfully.")
+        cli_update_args = [
+            "update-a-bookmark",
+            "--bookmark-id",
+            created_bookmark_id,
+            "--update-data",
+            cli_update_payload_json,
+        ]
 
-            # 4. Verify CLI update by fetching the bookmark again
-            logger.info(
-                f"\nFetching bookmark ID {created_bookmark_id} to verify CLI title update."
-            )
-            retrieved_bookmark_after_cli_update = karakeep_client.get_a_single_bookmark(
-                bookmark_id=created_bookmark_id
-            )
-            assert isinstance(retrieved_bookmark_after_cli_update, datatypes.Bookmark)
-            assert retrieved_bookmark_after_cli_update.title == target_cli_title, (
-                f"Retrieved bookmark title '{retrieved_bookmark_after_cli_update.title}' after CLI update does not match expected '{target_cli_title}'"
-            )
+        result = cli_runner.invoke(cli, cli_update_args, obj={})
+        if result.exit_code != 0:
             logger.info(
-                f"✓ Successfully verified bookmark title updated by CLI to: '{retrieved_bookmark_after_cli_update.title}'"
+                f"  CLI update command failed with exit code {result.exit_code}"
             )
+            logger.info(f"  Command: {cli_update_args}")
+            logger.info(f"  Output: {result.output}")
+        assert result.exit_code == 0, (
+            f"CLI command for update-a-bookmark failed: {result.exception}"
+        )
+        logger.info("✓ CLI update command executed successfully.")
 
-        except subprocess.CalledProcessError as e:
-            logger.info(f"  CLI update command failed with exit code {e.returncode}")
-            logger.info(f"  Command: {cli_update_command}")
-            logger.info(f"  Stdout: {e.stdout}")
-            logger.info(f"  Stderr: {e.stderr}")
-            pytest.fail(f"CLI command for update-a-bookmark failed: {e}")
-        except Exception as e:
-            pytest.fail(
-                f"An unexpected error occurred running the CLI update command: {e}"
-            )
+        # 3. Verify CLI update by fetching the bookmark again
+        logger.info(
+            f"\nFetching bookmark ID {created_bookmark_id} to verify CLI title update."
+        )
+        retrieved_bookmark_after_cli_update = karakeep_client.get_a_single_bookmark(
+            bookmark_id=created_bookmark_id
+        )
+        assert isinstance(retrieved_bookmark_after_cli_update, datatypes.Bookmark)
+        assert retrieved_bookmark_after_cli_update.title == target_cli_title, (
+            f"Retrieved bookmark title '{retrieved_bookmark_after_cli_update.title}' after CLI update does not match expected '{target_cli_title}'"
+        )
+        logger.info(
+            f"✓ Successfully verified bookmark title updated by CLI to: '{retrieved_bookmark_after_cli_update.title}'"
+        )
 
     except (APIError, AuthenticationError) as e:
         pytest.fail(f"API error during bookmark title update test: {e}")
-    except Exception as e:
-        pytest.fail(
-            f"An unexpected error occurred during bookmark title update test: {e}"
-        )
     # No finally block needed for deletion, as 'managed_bookmark' fixture handles it.
 
 
 def test_tag_lifecycle_on_bookmark(
-    karakeep_client: KarakeepAPI, managed_bookmark: datatypes.Bookmark
+    karakeep_client: KarakeepAPI, managed_bookmark: datatypes.Bookmark, run_id: str
 ):
     """
     Test attaching a tag to a bookmark, updating the tag, detaching it, and deleting it.
     Uses the managed_bookmark fixture.
     """
     bookmark_id = managed_bookmark.id
-    timestamp = int(time.time())
-    random_chars = "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    initial_tag_name = f"test-tag-{timestamp}-{random_chars}"
-    updated_tag_name = f"updated-tag-{timestamp}-{random_chars}"
+    initial_tag_name = f"test-tag-{run_id}"
+    updated_tag_name = f"updated-tag-{run_id}"
     tag_id_to_manage = None
 
     try:
@@ -621,28 +404,14 @@ def test_tag_lifecycle_on_bookmark(
         # assert isinstance(updated_tag, datatypes.Tag), "Update tag response should be Tag model"
         # assert updated_tag.name == updated_tag_name, "Tag name was not updated as expected"
         # logger.info(f"✓ Tag {tag_id_to_manage} updated to name '{updated_tag.name}'")
+        # The update response already holds the tag, no need to GET it again
         assert updated_tag["name"] == updated_tag_name, (
             "Tag name was not updated as expected"
         )
+        assert updated_tag["id"] == tag_id_to_manage, "Updated tag ID does not match"
         logger.info(f"✓ Tag {tag_id_to_manage} updated to name '{updated_tag['name']}'")
 
-        # 3. Verify tag update by getting it directly
-        logger.info(
-            f"\nFetching tag {tag_id_to_manage} to verify its name is '{updated_tag_name}'"
-        )
-        retrieved_tag = karakeep_client.get_a_single_tag(tag_id=tag_id_to_manage)
-        assert isinstance(retrieved_tag, datatypes.Tag), (
-            "Get single tag response should be Tag model"
-        )
-        assert retrieved_tag.name == updated_tag_name, (
-            "Retrieved tag name does not match updated name"
-        )
-        assert retrieved_tag.id == tag_id_to_manage, "Retrieved tag ID does not match"
-        logger.info(
-            f"✓ Verified tag {tag_id_to_manage} has name '{retrieved_tag.name}'"
-        )
-
-        # 4. Detach the tag from the bookmark
+        # 3. Detach the tag from the bookmark
         logger.info(
             f"\nAttempting to detach tag {tag_id_to_manage} from bookmark {bookmark_id}"
         )
@@ -657,29 +426,23 @@ def test_tag_lifecycle_on_bookmark(
 
     except (APIError, AuthenticationError) as e:
         pytest.fail(f"API error during tag lifecycle test: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred during tag lifecycle test: {e}")
     finally:
-        # 5. Delete the tag (ensure cleanup even if assertions fail mid-test)
+        # 4. Delete the tag (ensure cleanup even if assertions fail mid-test)
         if tag_id_to_manage:
             logger.info(f"\nAttempting to delete tag {tag_id_to_manage} (cleanup)")
             try:
                 karakeep_client.delete_a_tag(tag_id=tag_id_to_manage)
                 logger.info(f"✓ Successfully deleted tag {tag_id_to_manage}")
 
-                # 6. Verify the tag is gone by trying to get it (should fail with 404)
-                try:
+                # 5. Verify the tag is gone by trying to get it (should fail with 404)
+                with pytest.raises(APIError) as excinfo:
                     karakeep_client.get_a_single_tag(tag_id=tag_id_to_manage)
-                    pytest.fail(
-                        f"Tag {tag_id_to_manage} should not exist after deletion, but get_a_single_tag succeeded."
-                    )
-                except APIError as e:
-                    assert e.status_code == 404, (
-                        f"Expected 404 Not Found when getting deleted tag, but got status {e.status_code}"
-                    )
-                    logger.info(
-                        f"✓ Confirmed tag {tag_id_to_manage} is deleted (received 404)."
-                    )
+                assert excinfo.value.status_code == 404, (
+                    f"Expected 404 Not Found when getting deleted tag, but got status {excinfo.value.status_code}"
+                )
+                logger.info(
+                    f"✓ Confirmed tag {tag_id_to_manage} is deleted (received 404)."
+                )
             except (APIError, AuthenticationError) as e:
                 # Log error during cleanup but don't let it mask original test failure
                 logger.info(
@@ -698,11 +461,18 @@ def test_tag_lifecycle_on_bookmark(
 # --- Test User Info/Stats Endpoints ---
 
 
-def test_cli_get_bookmarks_count_with_jq(karakeep_client: KarakeepAPI):
+def test_cli_get_bookmarks_count_with_jq(
+    karakeep_client: KarakeepAPI, cli_runner: CliRunner
+):
     """Test that CLI get-all-bookmarks with --limit returns the expected number of items."""
     # Skip test if jq is not installed
     try:
-        subprocess.run(["jq", "--version"], check=True, capture_output=True)
+        subprocess.run(
+            ["jq", "--version"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
     except (subprocess.CalledProcessError, FileNotFoundError):
         pytest.skip("jq is not installed. This test requires jq for JSON processing.")
 
@@ -711,21 +481,26 @@ def test_cli_get_bookmarks_count_with_jq(karakeep_client: KarakeepAPI):
 
     try:
         logger.info(f"\nRunning CLI command: get-all-bookmarks --limit={test_limit}")
-        # Use a two-command pipe: Run the CLI command and pipe to jq to count array length
-        cmd = f"python -m karakeep_python_api --verbose get-all-bookmarks --limit={test_limit} | jq 'length'"
-
-        # Execute the piped command
+        # Run the CLI command, then feed its output to jq to count array length
+        cli_result = cli_runner.invoke(
+            cli,
+            ["--verbose", "get-all-bookmarks", f"--limit={test_limit}"],
+            obj={},
+        )
+        if cli_result.exit_code != 0:
+            logger.error(f"CLI command failed with exit code {cli_result.exit_code}")
+            logger.error(f"Output: {cli_result.output}")
+            pytest.fail(f"CLI command failed: {cli_result.exception}")
         result = subprocess.run(
-            cmd,
-            shell=True,
+            ["jq", "length"],
+            input=cli_result.stdout.encode(),
             check=True,
             capture_output=True,
-            text=True,
         )
 
         # Parse the output (should be just a number)
         try:
-            actual_count = int(result.stdout.strip())
+            actual_count = int(result.stdout.decode().strip())
             logger.info(f"✓ Command returned {actual_count} bookmarks")
 
             # Check if we got exactly the requested number or fewer (if there aren't enough bookmarks)
@@ -753,13 +528,22 @@ def test_cli_get_bookmarks_count_with_jq(karakeep_client: KarakeepAPI):
             pytest.fail(f"jq output is not a valid integer: '{result.stdout}'")
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed with exit code {e.returncode}")
-        logger.error(f"Stdout: {e.stdout}")
-        logger.error(f"Stderr: {e.stderr}")
-        pytest.fail(f"CLI command failed: {e}")
-    except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
-        pytest.fail(f"Unexpected error: {e}")
+        logger.error(f"jq failed with exit code {e.returncode}")
+        logger.error(f"Stderr: {e.stderr.decode(errors='replace')}")
+        pytest.fail(f"jq command failed: {e}")
+
+
+class UserStatsCounts(BaseModel):
+    """
+    Counters the stats endpoint must return. The client returns this response as
+    an unvalidated dict, so the test checks it against this model in one call.
+    Other keys are ignored.
+    """
+
+    numBookmarks: StrictInt = Field(ge=0)
+    numHighlights: StrictInt = Field(ge=0)
+    numLists: StrictInt = Field(ge=0)
+    numTags: StrictInt = Field(ge=0)
 
 
 def test_get_current_user_stats(karakeep_client: KarakeepAPI):
@@ -767,56 +551,24 @@ def test_get_current_user_stats(karakeep_client: KarakeepAPI):
     try:
         stats = karakeep_client.get_current_user_stats()
         assert isinstance(stats, dict), "Response should be a dictionary"
-        # Check for the presence of expected keys (adjust based on actual API response)
-        assert "numBookmarks" in stats, "Stats should contain 'numBookmarks'"
-        assert "numHighlights" in stats, "Stats should contain 'numHighlights'"
-        assert "numLists" in stats, "Stats should contain 'numLists'"
-        assert "numTags" in stats, "Stats should contain 'numTags'"
-        # Check that values are non-negative integers
-        assert isinstance(stats["numBookmarks"], int) and stats["numBookmarks"] >= 0
-        assert isinstance(stats["numHighlights"], int) and stats["numHighlights"] >= 0
-        assert isinstance(stats["numLists"], int) and stats["numLists"] >= 0
-        assert isinstance(stats["numTags"], int) and stats["numTags"] >= 0
+        # Raises a ValidationError listing every missing, non-integer or negative count
+        UserStatsCounts.model_validate(stats)
 
         logger.info(f"✓ Successfully retrieved user stats: {stats}")
 
     except (APIError, AuthenticationError) as e:
         pytest.fail(f"API error during user stats retrieval: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred during user stats retrieval: {e}")
-
-    # --- Add CLI call ---
-    try:
-        logger.info("\n  Running CLI equivalent: get-current-user-stats")
-        # Assumes KARAKEEP_PYTHON_API_ENDPOINT and KARAKEEP_PYTHON_API_KEY are set in env
-        subprocess.run(
-            "python -m karakeep_python_api get-current-user-stats",
-            shell=True,
-            check=True,
-            capture_output=True,  # Capture output to avoid logger.infoing it during tests unless verbose
-            text=True,
-        )
-        logger.info("✓ CLI command executed successfully.")
-    except subprocess.CalledProcessError as e:
-        logger.info(f"  CLI command failed with exit code {e.returncode}")
-        # logger.info stdout/stderr only if the command failed to aid debugging
-        logger.info(f"  Stdout: {e.stdout}")
-        logger.info(f"  Stderr: {e.stderr}")
-        pytest.fail(f"CLI command 'get-current-user-stats' failed: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred running the CLI command: {e}")
 
 
-def test_asset_lifecycle_with_pdf(karakeep_client: KarakeepAPI):
+@pytest.mark.xdist_group("karakeep_mutation")
+def test_asset_lifecycle_with_pdf(karakeep_client: KarakeepAPI, run_id: str):
     """Test creating a PDF bookmark, verifying its asset, and deleting it."""
     pdf_file_path = "tests/PDF Bookmark Sample.pdf"
     uploaded_asset_id = None
     created_bookmark_id = None
 
-    # Generate unique title to avoid collisions
-    timestamp = int(time.time())
-    random_suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    bookmark_title = f"Test PDF Bookmark {timestamp}-{random_suffix}"
+    # Unique title to avoid collisions
+    bookmark_title = f"Test PDF Bookmark {run_id}"
 
     try:
         # 1. Upload the PDF asset
@@ -875,8 +627,6 @@ def test_asset_lifecycle_with_pdf(karakeep_client: KarakeepAPI):
         pytest.skip(f"PDF test file not found: {pdf_file_path}")
     except (APIError, AuthenticationError) as e:
         pytest.fail(f"API error during PDF asset test: {e}")
-    except Exception as e:
-        pytest.fail(f"Unexpected error during PDF asset test: {e}")
     finally:
         # 5. Clean up: Delete the bookmark
         if created_bookmark_id:
@@ -892,19 +642,13 @@ def test_asset_lifecycle_with_pdf(karakeep_client: KarakeepAPI):
             logger.info("\nNo bookmark to clean up")
 
 
-def test_backup_lifecycle(karakeep_client: KarakeepAPI):
+@pytest.mark.xdist_group("karakeep_mutation")
+def test_backup_lifecycle(karakeep_client: KarakeepAPI, cli_runner: CliRunner):
     """Test creating, retrieving, downloading, and deleting a backup."""
     created_backup_id = None
 
     try:
-        # 1. Get initial backup count
-        logger.info("\nGetting initial backup list")
-        initial_backups = karakeep_client.get_all_backups()
-        assert isinstance(initial_backups, list), "Response should be a list"
-        initial_backup_count = len(initial_backups)
-        logger.info(f"  Initial backup count: {initial_backup_count}")
-
-        # 2. Trigger a new backup
+        # 1. Trigger a new backup
         logger.info("\nTriggering a new backup")
         created_backup = karakeep_client.trigger_a_new_backup()
         assert isinstance(created_backup, datatypes.Backup), (
@@ -918,20 +662,19 @@ def test_backup_lifecycle(karakeep_client: KarakeepAPI):
         logger.info(f"✓ Successfully triggered backup with ID: {created_backup_id}")
         logger.info(f"  Backup status: {created_backup.status}")
 
-        # 3. Verify the backup appears in get_all_backups
+        # 2. Verify the backup appears in get_all_backups
+        # Only check membership, the total count is not stable under concurrent runs
         logger.info(f"\nVerifying backup {created_backup_id} appears in backup list")
         current_backups = karakeep_client.get_all_backups()
-        assert len(current_backups) >= initial_backup_count + 1, (
-            "Backup count should increase after creation"
-        )
-        assert any(backup.id == created_backup_id for backup in current_backups), (
+        assert isinstance(current_backups, list), "Response should be a list"
+        assert created_backup_id in {backup.id for backup in current_backups}, (
             "Created backup should be present in the list of all backups"
         )
         logger.info(
             f"✓ Verified backup {created_backup_id} is present in get_all_backups"
         )
 
-        # 4. Get the backup by ID to verify it exists
+        # 3. Get the backup by ID to verify it exists
         logger.info(f"\nRetrieving backup {created_backup_id} by ID")
         retrieved_backup = karakeep_client.get_a_single_backup(
             backup_id=created_backup_id
@@ -943,7 +686,7 @@ def test_backup_lifecycle(karakeep_client: KarakeepAPI):
         logger.info(f"  Bookmark count: {retrieved_backup.bookmarkCount}")
         logger.info(f"  Size: {retrieved_backup.size} bytes")
 
-        # 5. Try to download the backup (only if status is "success")
+        # 4. Try to download the backup (only if status is "success")
         if retrieved_backup.status == "success" and retrieved_backup.assetId:
             logger.info(f"\nAttempting to download backup {created_backup_id}")
             try:
@@ -969,48 +712,42 @@ def test_backup_lifecycle(karakeep_client: KarakeepAPI):
                 f"  Skipping download test (status: {retrieved_backup.status}, assetId: {retrieved_backup.assetId})"
             )
 
-        # 6. Test CLI equivalent for getting all backups
+        # 5. Test CLI equivalent for getting all backups
         logger.info("\n  Running CLI equivalent: get-all-backups")
-        try:
-            subprocess.run(
-                "python -m karakeep_python_api get-all-backups",
-                shell=True,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            logger.info("✓ CLI command executed successfully.")
-        except subprocess.CalledProcessError as e:
-            logger.info(f"  CLI command failed with exit code {e.returncode}")
-            logger.info(f"  Stdout: {e.stdout}")
-            logger.info(f"  Stderr: {e.stderr}")
-            pytest.fail(f"CLI command 'get-all-backups' failed: {e}")
+        result = cli_runner.invoke(cli, ["get-all-backups"], obj={})
+        if result.exit_code != 0:
+            logger.info(f"  CLI command failed with exit code {result.exit_code}")
+            logger.info(f"  Output: {result.output}")
+        assert result.exit_code == 0, (
+            f"CLI command 'get-all-backups' failed: {result.exception}"
+        )
+        # Parse the output once and check the ids, a substring match on the raw
+        # output could also hit the id inside another field
+        cli_backup_ids = {backup["id"] for backup in json.loads(result.stdout)}
+        assert created_backup_id in cli_backup_ids, (
+            "Created backup should be present in the CLI get-all-backups output"
+        )
+        logger.info("✓ CLI command executed successfully.")
 
     except (APIError, AuthenticationError) as e:
         pytest.fail(f"API error during backup lifecycle test: {e}")
-    except Exception as e:
-        pytest.fail(f"An unexpected error occurred during backup lifecycle test: {e}")
     finally:
-        # 7. Clean up: Delete the backup
+        # 6. Clean up: Delete the backup
         if created_backup_id:
             logger.info(f"\nCleaning up: Deleting backup {created_backup_id}")
             try:
                 karakeep_client.delete_a_backup(backup_id=created_backup_id)
                 logger.info(f"✓ Successfully deleted backup {created_backup_id}")
 
-                # 8. Verify the backup is deleted
-                try:
+                # 7. Verify the backup is deleted
+                with pytest.raises(APIError) as excinfo:
                     karakeep_client.get_a_single_backup(backup_id=created_backup_id)
-                    pytest.fail(
-                        f"Backup {created_backup_id} should not exist after deletion, but get_a_single_backup succeeded."
-                    )
-                except APIError as e:
-                    assert e.status_code == 404, (
-                        f"Expected 404 Not Found when getting deleted backup, but got status {e.status_code}"
-                    )
-                    logger.info(
-                        f"✓ Confirmed backup {created_backup_id} is deleted (received 404)"
-                    )
+                assert excinfo.value.status_code == 404, (
+                    f"Expected 404 Not Found when getting deleted backup, but got status {excinfo.value.status_code}"
+                )
+                logger.info(
+                    f"✓ Confirmed backup {created_backup_id} is deleted (received 404)"
+                )
 
             except (APIError, AuthenticationError) as e:
                 logger.info(